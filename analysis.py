@@ -10,9 +10,10 @@ by Gene K. Ressler
 
 """
 from __future__ import annotations
-from enum import Enum
-from math import sqrt
-from typing import TYPE_CHECKING, List, Tuple
+from enum import IntEnum
+from typing import TYPE_CHECKING, Tuple
+
+import numpy as np
 from py_bridge_designer.scenario import ARCH_SUPPORT, CABLE_SUPPORT_LEFT, CABLE_SUPPORT_BOTH, INTERMEDIATE_SUPPORT, HIGH_PIER
 from py_bridge_designer.cost import calculate_cost
 
@@ -21,84 +22,100 @@ if TYPE_CHECKING:
     from py_bridge_designer.bridge import Bridge
 
 
-def _fold_max(max: float, x: float) -> float:
-    return x if x > max else max
-
-
-def _square(x: float) -> float:
-    return x * x
-
-
-class AnalysisError(Enum):
+class AnalysisError(IntEnum):
     NoAnalysisError = 0
     AnalysisBadPivot = 2
 
 
-class FailMode(Enum):
+class FailMode(IntEnum):
     FailModeNone = 0
     FailModeBuckles = 1
     FailModeYields = 2
     FailModeSlenderness = 3
 
 
-class MemberStrength():
-    def __init__(self,
-                 compressive: float,
-                 tensile: float,
-                 compressive_fail_mode: FailMode,
-                 tensile_fail_mode: FailMode):
-        self.compressive = compressive
-        self.tensile = tensile
-        self.compressive_fail_mode = compressive_fail_mode
-        self.tensile_fail_mode = tensile_fail_mode
+# Structured dtypes standing in for the old MemberStrength/MaxForces
+# object lists. Viewed as recarrays so entries still read like
+# member_strength[i].compressive etc.
+MEMBER_STRENGTH_DTYPE = np.dtype([
+    ('compressive', np.float64),
+    ('tensile', np.float64),
+    ('compressive_fail_mode', np.int8),
+    ('tensile_fail_mode', np.int8),
+])
 
-
-class MaxForces():
-    def __init__(self,
-                 compression: float,
-                 tension: float):
-        self.compression = compression
-        self.tension = tension
+MAX_FORCES_DTYPE = np.dtype([
+    ('compression', np.float64),
+    ('tension', np.float64),
+])
 
 
 class Analysis():
-    def __init__(self, bridge: Bridge, test_print=False):
+    def __init__(self, bridge: Bridge, test_print=False, dtype=np.float64):
+        """
+        Args:
+            bridge: the Bridge to analyze
+            test_print: print load/displacement tables for debugging
+            dtype: float dtype for the solve matrices. np.float32 halves
+                the bytes moved for screening-style evaluations; keep
+                the np.float64 default for final results.
+        """
         self._bridge = bridge
         self.error = AnalysisError.NoAnalysisError
         self.test_print = test_print
+        self.dtype = np.dtype(dtype)
 
-        # Fill restaint vectors with False values
-        self.x_restraints = [False for _ in range(bridge.n_joints + 1)]
-        self.y_restraints = [False for _ in range(bridge.n_joints + 1)]
+        # Fill restaint vectors with False values (0-based by joint)
+        self.x_restraints = np.zeros(bridge.n_joints, dtype=bool)
+        self.y_restraints = np.zeros(bridge.n_joints, dtype=bool)
 
         # Initialize stiffness matrix
         self.n_equations = self._bridge.n_joints * 2
-        self.stiffness = [
-            [0.0 for _ in range(self.n_equations)] for _ in range(self.n_equations)
-        ]
+        self.stiffness = np.zeros(
+            (self.n_equations, self.n_equations), dtype=self.dtype)
 
         # Initialize the dispacement matrix
-        self.displacement = [
-            [0.0 for _ in range(self._bridge.n_load_instances)] for _ in range(self.n_equations)
-        ]
+        self.displacement = np.zeros(
+            (self.n_equations, self._bridge.n_load_instances), dtype=self.dtype)
 
         # Initialize the member_force matrix
-        self.member_force = [
-            [0.0 for _ in range(self._bridge.n_load_instances)] for _ in range(self._bridge.n_members)
-        ]
+        self.member_force = np.zeros(
+            (self._bridge.n_members, self._bridge.n_load_instances), dtype=self.dtype)
+
+        # Contiguous copy of the bridge's load instances, shape
+        # (n_load_instances, n_equations), so restraint zeroing cannot
+        # leak back into the bridge's buffer.
+        self.loads = np.array(bridge.load_instances, dtype=self.dtype)
 
-        # Initialize member_strength vector
-        self.member_strength: List[MemberStrength] = [
-            MemberStrength(0.0, 0.0, FailMode.FailModeNone, FailMode.FailModeNone) for _ in range(self._bridge.n_members + 1)
-        ]
+        # Initialize member_strength vector (indexed by member number - 1)
+        self.member_strength = np.zeros(
+            self._bridge.n_members, dtype=MEMBER_STRENGTH_DTYPE).view(np.recarray)
 
-        # Initialize max_forces vector
-        self.max_forces: List[MaxForces] = [
-            MaxForces(0.0, 0.0) for _ in range(self._bridge.n_members + 1)]
+        # Initialize max_forces vector (indexed by member number - 1)
+        self.max_forces = np.zeros(
+            self._bridge.n_members, dtype=MAX_FORCES_DTYPE).view(np.recarray)
 
         self.n_compressive_failures = 0
         self.n_tensile_failures = 0
 
+        # Gather per-member data into structure-of-arrays form once, so
+        # the assembly and strength kernels run as vector expressions
+        # instead of chasing member/cross-section attributes per entry.
+        self._gather_member_arrays()
+
+    def _gather_member_arrays(self):
+        arrays = self._bridge._precompute_member_arrays()
+        self._member_j1 = arrays['j1']
+        self._member_j2 = arrays['j2']
+        self._member_cos_x = arrays['cos_x']
+        self._member_cos_y = arrays['cos_y']
+        self._member_length = arrays['length']
+        self._member_area = arrays['area']
+        self._member_moment = arrays['moment']
+        self._member_E = arrays['E']
+        self._member_Fy = arrays['Fy']
+        self._member_ae_over_l = arrays['ae_over_l']
+
     def _apply_restraints(self):
         n_loaded_joints = self._bridge.load_scenario.n_loaded_joints
 
@@ -107,13 +124,13 @@ class Analysis():
         # ======================
 
         # Left side...
-        self.x_restraints[1] = True
-        self.y_restraints[1] = True
+        self.x_restraints[0] = True
+        self.y_restraints[0] = True
         # Right side...
-        self.y_restraints[n_loaded_joints] = True
+        self.y_restraints[n_loaded_joints - 1] = True
 
         # Set up index to point to joint after last loaded joint
-        joint_index = n_loaded_joints + 1
+        joint_index = n_loaded_joints
         support_type = self._bridge.load_scenario.support_type
 
         # ===============================
@@ -122,9 +139,9 @@ class Analysis():
         if support_type == INTERMEDIATE_SUPPORT:
             if self._bridge.load_scenario.support_type == HIGH_PIER:
                 intermed_joint_num = self._bridge.load_scenario.intermediate_support_joint_no
-                self.x_restraints[intermed_joint_num] = True
-                self.y_restraints[intermed_joint_num] = True
-                self.x_restraints[1] = False
+                self.x_restraints[intermed_joint_num - 1] = True
+                self.y_restraints[intermed_joint_num - 1] = True
+                self.x_restraints[0] = False
             else:
                 self.x_restraints[joint_index] = True
                 self.y_restraints[joint_index] = True
@@ -141,10 +158,10 @@ class Analysis():
                 joint_index += 1
             # Undo simple support
             # Left side...
-            self.x_restraints[1] = False
-            self.y_restraints[1] = False
+            self.x_restraints[0] = False
+            self.y_restraints[0] = False
             # Right side...
-            self.y_restraints[n_loaded_joints] = False
+            self.y_restraints[n_loaded_joints - 1] = False
 
         # ==========================
         # Adjust for cable supports
@@ -157,211 +174,235 @@ class Analysis():
             self.x_restraints[joint_index] = True
             self.y_restraints[joint_index] = True
 
-    def _get_stiffness(self, i: int, j: int):
-        return self.stiffness[i - 1][j - 1]
-
-    def _set_stiffness(self, i: int, j: int, x: float):
-        self.stiffness[i - 1][j - 1] = x
-
-    def _increment_stiffness(self, i: int, j: int, x: float):
-        prev_x = self._get_stiffness(i, j)
-        self._set_stiffness(i, j, prev_x + x)
-
-    def _decrement_stiffness(self, i: int, j: int, x: float):
-        prev_x = self._get_stiffness(i, j)
-        self._set_stiffness(i, j, prev_x - x)
-
-    def _divide_stiffness(self, i: int, j: int, x: float):
-        prev_x = self._get_stiffness(i, j)
-        self._set_stiffness(i, j, prev_x / x)
-
     def _apply_initial_stiffness(self):
-        for member in self._bridge.members:
-            j1 = member.start_joint.number
-            j2 = member.end_joint.number
-            xs = member.cross_section
-            ae_over_l = self._bridge.parameters.shapes[xs.section][xs.size].area * \
-                xs.material.E / member.length
-            xx = ae_over_l * _square(member.cos_x)
-            yy = ae_over_l * _square(member.cos_y)
-            xy = ae_over_l * member.cos_x * member.cos_y
-
-            j12m1 = 2 * j1 - 1
-            j12 = 2 * j1
-            j22m1 = 2 * j2 - 1
-            j22 = 2 * j2
-
-            self._increment_stiffness(j12m1, j12m1, xx)
-            self._increment_stiffness(j12m1, j12, xy)
-            self._decrement_stiffness(j12m1, j22m1, xx)
-            self._decrement_stiffness(j12m1, j22, xy)
-            self._increment_stiffness(j12, j12m1, xy)
-            self._increment_stiffness(j12, j12, yy)
-            self._decrement_stiffness(j12, j22m1, xy)
-            self._decrement_stiffness(j12, j22, yy)
-            self._decrement_stiffness(j22m1, j12m1, xx)
-            self._decrement_stiffness(j22m1, j12, xy)
-            self._increment_stiffness(j22m1, j22m1, xx)
-            self._increment_stiffness(j22m1, j22, xy)
-            self._decrement_stiffness(j22, j12m1, xy)
-            self._decrement_stiffness(j22, j12, yy)
-            self._increment_stiffness(j22, j22m1, xy)
-            self._increment_stiffness(j22, j22, yy)
+        # Compute the 16 coefficients of every member's local stiffness
+        # block as vector expressions over the SoA arrays, then scatter
+        # them into the global matrix in one call.
+        ae_over_l = self._member_ae_over_l
+        xx = ae_over_l * self._member_cos_x * self._member_cos_x
+        yy = ae_over_l * self._member_cos_y * self._member_cos_y
+        xy = ae_over_l * self._member_cos_x * self._member_cos_y
+
+        # The scatter index pattern depends only on the member topology,
+        # which is append-only on a Bridge, so it is cached there and
+        # rebuilt only when members have been added since the last
+        # analysis. Values are recomputed every pass.
+        bridge = self._bridge
+        pattern = getattr(bridge, '_assembly_pattern', None)
+        if pattern is None or pattern[0] != bridge.n_members:
+            # 0-based equation indices for the x/y dof of each joint
+            dofs = np.stack((2 * self._member_j1 - 2, 2 * self._member_j1 - 1,
+                             2 * self._member_j2 - 2, 2 * self._member_j2 - 1))
+            rows = np.repeat(dofs, 4, axis=0).ravel()
+            cols = np.tile(dofs, (4, 1)).ravel()
+            upper = rows <= cols
+            pattern = (bridge.n_members, rows[upper], cols[upper], upper)
+            bridge._assembly_pattern = pattern
+        _, upper_rows, upper_cols, upper = pattern
+
+        block = ((xx, xy), (xy, yy))
+        values = np.empty((16, len(ae_over_l)), dtype=np.float64)
+        for a in range(4):
+            for b in range(4):
+                sign = 1.0 if (a < 2) == (b < 2) else -1.0
+                values[4 * a + b] = sign * block[a % 2][b % 2]
+
+        # The matrix is symmetric, so scatter only the upper-triangle
+        # entries (10 of the 16 per member) and mirror them afterwards.
+        np.add.at(self.stiffness, (upper_rows, upper_cols),
+                  values.ravel()[upper])
+        upper_index = np.triu_indices(self.n_equations, 1)
+        self.stiffness[upper_index[1], upper_index[0]
+                       ] = self.stiffness[upper_index]
 
     def _apply_support_restraints(self):
-        for point_load in self._bridge.load_instances:
-            for joint_index in range(1, self._bridge.n_joints + 1):
-                if self.x_restraints[joint_index]:
-                    i2m1 = 2 * joint_index - 1
-                    for j in range(1, self.n_equations + 1):
-                        self._set_stiffness(i2m1, j, 0.0)
-                        self._set_stiffness(j, i2m1, 0.0)
-                    self._set_stiffness(i2m1, i2m1, 1.0)
-                    point_load[i2m1] = 0.0
-                if self.y_restraints[joint_index]:
-                    i2 = 2 * joint_index
-                    for j in range(1, self.n_equations + 1):
-                        self._set_stiffness(i2, j, 0.0)
-                        self._set_stiffness(j, i2, 0.0)
-                    self._set_stiffness(i2, i2, 1.0)
-                    point_load[i2] = 0.0
+        # Interleave the per-joint restraint flags into one boolean mask
+        # over the equations, then zero the restrained rows/columns and
+        # pin the diagonal with slice assignments.
+        restrained = np.zeros(self.n_equations, dtype=bool)
+        restrained[0::2] = self.x_restraints
+        restrained[1::2] = self.y_restraints
+        restrained_index = np.flatnonzero(restrained)
+
+        self.stiffness[restrained_index, :] = 0.0
+        self.stiffness[:, restrained_index] = 0.0
+        self.stiffness[restrained_index, restrained_index] = 1.0
+
+        self.loads[:, restrained_index] = 0.0
 
     def _invert(self) -> bool:
-        for equation_index in range(1, self.n_equations + 1):
-            pivot = self._get_stiffness(equation_index, equation_index)
+        stiffness = self.stiffness
+        for equation_index in range(self.n_equations):
+            pivot = stiffness[equation_index, equation_index]
             if abs(pivot) < 0.99:
                 self.error = AnalysisError.AnalysisBadPivot
                 return False
 
             pivr = 1.0 / pivot
-            for k in range(1, self.n_equations + 1):
-                self._divide_stiffness(equation_index, k, pivot)
-
-            for k in range(1, self.n_equations + 1):
-                if k != equation_index:
-                    pivot = self._get_stiffness(k, equation_index)
-                    for j in range(1, self.n_equations + 1):
-                        decrement_by = self._get_stiffness(
-                            equation_index, j) * pivot
-                        self._decrement_stiffness(k, j, decrement_by)
-                    self._set_stiffness(k, equation_index, -pivot * pivr)
-            self._set_stiffness(equation_index, equation_index, pivr)
+            stiffness[equation_index, :] /= pivot
+
+            # Eliminate the pivot column from every other row in one
+            # rank-1 update, then restore the pivot row/column entries
+            # the Gauss-Jordan inverse keeps in place.
+            pivot_column = stiffness[:, equation_index].copy()
+            pivot_column[equation_index] = 0.0
+            stiffness -= np.outer(pivot_column, stiffness[equation_index, :])
+            stiffness[:, equation_index] = -pivot_column * pivr
+            stiffness[equation_index, equation_index] = pivr
         return True
 
-    def _get_displacement(self, i: int, j: int):
-        return self.displacement[i - 1][j - 1]
-
-    def _set_displacement(self, i: int, j: int, x: float):
-        self.displacement[i - 1][j - 1] = x
-
-    def _get_member_force(self, i: int, j: int):
-        return self.member_force[i - 1][j - 1]
-
-    def _set_member_force(self, i: int, j: int, x: float):
-        self.member_force[i - 1][j - 1] = x
-
-    def _compute_end_forces(self, load_instance_index: int):
-        for member in self._bridge.members:
-            xs = member.cross_section
-            ae_over_l = self._bridge.parameters.shapes[xs.section][xs.size].area * \
-                xs.material.E / member.length
-            j1 = member.start_joint.number
-            j2 = member.end_joint.number
-            end_force = ae_over_l * \
-                ((member.cos_x * (self._get_displacement((2 * j2 - 1), load_instance_index) - self._get_displacement((2 * j1 - 1), load_instance_index))
-                  ) + (member.cos_y * (self._get_displacement((2 * j2), load_instance_index) - self._get_displacement((2 * j1), load_instance_index))))
-            self._set_member_force(
-                member.number, load_instance_index, end_force)
+    def _compute_end_forces(self):
+        # Axial force of every member under every load case in one
+        # gather-and-multiply over the displacement matrix.
+        j1 = self._member_j1
+        j2 = self._member_j2
+        displacement = self.displacement
+        dx = displacement[2 * j2 - 2, :] - displacement[2 * j1 - 2, :]
+        dy = displacement[2 * j2 - 1, :] - displacement[2 * j1 - 1, :]
+        self.member_force = self._member_ae_over_l[:, None] * \
+            (self._member_cos_x[:, None] * dx +
+             self._member_cos_y[:, None] * dy)
 
     def _compute_joint_displacements(self):
-        for load_instance_index in range(1, self._bridge.n_load_instances + 1):
-            for i in range(1, self.n_equations + 1):
-                temp = 0.0
-                for j in range(1, self.n_equations + 1):
-                    temp += self._get_stiffness(i, j) * \
-                        self._bridge.load_instances[load_instance_index][j]
-                self._set_displacement(i, load_instance_index, temp)
-
-            if self.test_print:
-                print("Joint displacements for Load Case", load_instance_index)
+        # displacement = K^-1 @ loads for all load cases at once
+        self.displacement = self.stiffness @ self.loads.T
+
+        if self.test_print:
+            for load_instance_index in range(self._bridge.n_load_instances):
+                print("Joint displacements for Load Case",
+                      load_instance_index + 1)
                 print("Jnt #     /\\X         /\\Y")
                 print("----- ----------- -----------")
-                for i in range(1, self._bridge.n_joints + 1):
-                    d1 = self._get_displacement(2 * i - 1, load_instance_index)
-                    d2 = self._get_displacement(2 * i, load_instance_index)
-                    print("%5d %11.5lf %11.5lf" % (i, d1, d2))
+                for i in range(self._bridge.n_joints):
+                    d1 = self.displacement[2 * i, load_instance_index]
+                    d2 = self.displacement[2 * i + 1, load_instance_index]
+                    print("%5d %11.5lf %11.5lf" % (i + 1, d1, d2))
 
-            self._compute_end_forces(load_instance_index)
+        self._compute_end_forces()
 
     def _compute_member_strengths(self):
-        for member in self._bridge.members:
-            xs = member.cross_section
-            compressive_fail_mode = FailMode.FailModeNone
-            compressive = 0.0
-            tensile_fail_mode = FailMode.FailModeNone
-            tensile = 0.0
-            Fy = xs.material.Fy
-            params = self._bridge.parameters
-            area = params.shapes[xs.section][xs.size].area
-            moment = params.shapes[xs.section][xs.size].moment
-            radius_of_gyration = sqrt(moment / area) if area > 0 else 0
-            slenderness = member.length / radius_of_gyration if radius_of_gyration > 0 else 0
-            support_type = self._bridge.load_scenario.support_type
-
-            # if the bridge has cable support joints or else slenderness is not excessive
-            if support_type == CABLE_SUPPORT_LEFT or support_type == CABLE_SUPPORT_BOTH or slenderness < params.slenderness_limit:
-                # Calculate lambda point
-                lam = _square(member.length) * Fy * area / \
-                    (9.8696044 * xs.material.E * moment)
-                if lam <= 2.25:
-                    compressive_fail_mode = FailMode.FailModeYields
-                    compressive = params.compression_resistance_factor * \
-                        pow(0.66, lam) * Fy * area
-                else:
-                    compressive_fail_mode = FailMode.FailModeBuckles
-                    compressive = params.compression_resistance_factor * 0.88 * Fy * area / lam
-
-                tensile_fail_mode = FailMode.FailModeYields
-                tensile = params.tension_resistance_factor * Fy * area
-            else:
-                compressive_fail_mode = FailMode.FailModeSlenderness
-                tensile_fail_mode = FailMode.FailModeSlenderness
-                compressive = 0.0
-                tensile = 0.0
+        params = self._bridge.parameters
+        area = self._member_area
+        moment = self._member_moment
+        length = self._member_length
+        Fy = self._member_Fy
+        support_type = self._bridge.load_scenario.support_type
 
-            # Append stats to member strength vector
-            self.member_strength[member.number] = MemberStrength(
-                compressive, tensile, compressive_fail_mode, tensile_fail_mode)
+        radius_of_gyration = np.sqrt(
+            np.divide(moment, area, out=np.zeros_like(moment), where=area > 0))
+        slenderness = np.divide(
+            length, radius_of_gyration,
+            out=np.zeros_like(length), where=radius_of_gyration > 0)
 
-    def _summarize_results(self):
-        for member in self._bridge.members:
-            max_compression = 0.0
-            max_tension = 0.0
-            for load_instance_index in range(1, self._bridge.n_load_instances + 1):
-                member_force = self._get_member_force(
-                    member.number, load_instance_index)
-                if member_force < 0:
-                    max_compression = _fold_max(max_compression, -member_force)
-                else:
-                    max_tension = _fold_max(max_tension, member_force)
-            self.max_forces[member.number] = MaxForces(
-                max_compression, max_tension)
-
-            ms = self.member_strength[member.number]
-
-            if ms.compressive_fail_mode != FailMode.FailModeSlenderness and max_compression < ms.compressive:
-                self.member_strength[member.number].compressive_fail_mode = FailMode.FailModeNone
-            else:
-                self.n_compressive_failures += 1
+        # Cable-supported bridges skip the slenderness screen entirely
+        if support_type == CABLE_SUPPORT_LEFT or support_type == CABLE_SUPPORT_BOTH:
+            within_limit = np.ones(len(length), dtype=bool)
+        else:
+            within_limit = slenderness < params.slenderness_limit
+
+        # Calculate lambda point
+        lam = length * length * Fy * area / \
+            (9.8696044 * self._member_E * moment)
+        yields = lam <= 2.25
+        compressive = np.where(
+            yields,
+            params.compression_resistance_factor * 0.66 ** lam * Fy * area,
+            params.compression_resistance_factor * 0.88 * Fy * area / lam)
+        compressive = np.where(within_limit, compressive, 0.0)
+        tensile = np.where(
+            within_limit, params.tension_resistance_factor * Fy * area, 0.0)
+        compressive_fail_mode = np.where(
+            within_limit,
+            np.where(yields, FailMode.FailModeYields.value,
+                     FailMode.FailModeBuckles.value),
+            FailMode.FailModeSlenderness.value)
+        tensile_fail_mode = np.where(
+            within_limit, FailMode.FailModeYields.value,
+            FailMode.FailModeSlenderness.value)
+
+        # Fill the member strength vector from the batch results.
+        # Members are numbered 1..n_members in list order.
+        member_strength = self.member_strength
+        member_strength.compressive[:] = compressive
+        member_strength.tensile[:] = tensile
+        member_strength.compressive_fail_mode[:] = compressive_fail_mode
+        member_strength.tensile_fail_mode[:] = tensile_fail_mode
 
-            if ms.tensile_fail_mode != FailMode.FailModeSlenderness and max_tension < ms.tensile:
-                self.member_strength[member.number].tensile_fail_mode = FailMode.FailModeNone
-            else:
-                self.n_tensile_failures += 1
+    def _summarize_results(self):
+        member_force = self.member_force
+        max_compression = np.maximum(-member_force, 0.0).max(axis=1)
+        max_tension = np.maximum(member_force, 0.0).max(axis=1)
+
+        self.max_forces.compression[:] = max_compression
+        self.max_forces.tension[:] = max_tension
+
+        member_strength = self.member_strength
+        slenderness_mode = FailMode.FailModeSlenderness.value
+        compression_ok = (member_strength.compressive_fail_mode != slenderness_mode) & \
+            (max_compression < member_strength.compressive)
+        tension_ok = (member_strength.tensile_fail_mode != slenderness_mode) & \
+            (max_tension < member_strength.tensile)
+        self.n_compressive_failures += int(
+            np.count_nonzero(~compression_ok))
+        self.n_tensile_failures += int(np.count_nonzero(~tension_ok))
+
+        member_strength.compressive_fail_mode[compression_ok] = FailMode.FailModeNone
+        member_strength.tensile_fail_mode[tension_ok] = FailMode.FailModeNone
+
+    def _is_stably_connected(self) -> bool:
+        """Quick connectivity screen run before the O(n^3) solve.
+
+        Any joint whose connected component contains no restrained
+        joint has a free rigid-body motion, so the stiffness matrix is
+        singular and the inversion is guaranteed to hit a bad pivot.
+        Union-find over the member joint arrays detects this without
+        assembling the matrix.
+        """
+        n_joints = self._bridge.n_joints
+        parent = np.arange(n_joints + 1, dtype=np.intp)
+
+        def find(i):
+            while parent[i] != i:
+                parent[i] = parent[parent[i]]  # path halving
+                i = parent[i]
+            return i
+
+        for j1, j2 in zip(self._member_j1, self._member_j2):
+            root_1 = find(j1)
+            root_2 = find(j2)
+            if root_1 != root_2:
+                parent[root_2] = root_1
+
+        roots = np.array([find(joint_number)
+                          for joint_number in range(1, n_joints + 1)],
+                         dtype=np.intp)
+        restrained = self.x_restraints | self.y_restraints
+        anchored = np.zeros(n_joints + 1, dtype=bool)
+        anchored[roots[restrained]] = True
+        return bool(anchored[roots].all())
 
     def get_results(self) -> Tuple[bool, int]:
         cost = calculate_cost(self._bridge)
         self._apply_restraints()
+
+        # Member strengths depend only on member geometry, so compute
+        # them up front: a member over the slenderness limit can never
+        # pass, which lets us reject the design before the O(n^3) solve.
+        self._compute_member_strengths()
+        slenderness_mode = FailMode.FailModeSlenderness.value
+        slender = self.member_strength.compressive_fail_mode == slenderness_mode
+        if slender.any():
+            n_slender = int(np.count_nonzero(slender))
+            self.n_compressive_failures += n_slender
+            self.n_tensile_failures += n_slender
+            return False, cost
+
+        # Detect structurally disconnected designs before paying for
+        # the matrix allocation-sized assembly and inversion
+        if not self._is_stably_connected():
+            self.error = AnalysisError.AnalysisBadPivot
+            return False, cost
+
         self._apply_initial_stiffness()
         self._apply_support_restraints()
         valid = self._invert()
@@ -369,7 +410,6 @@ class Analysis():
             return False, cost
 
         self._compute_joint_displacements()
-        self._compute_member_strengths()
         self._summarize_results()
 
         if self.error != AnalysisError.NoAnalysisError or self.n_compressive_failures > 0 or self.n_tensile_failures > 0:
@@ -12,11 +12,11 @@ by Gene K. Ressler
 from typing import List, Tuple
 from enum import IntEnum
 
-import cv2
+import numpy as np
 
 from py_bridge_designer.members import Joint, CrossSection, Member
-from py_bridge_designer.scenario import LoadScenario
-from py_bridge_designer.parameters import Params
+from py_bridge_designer.scenario import get_load_scenario
+from py_bridge_designer.parameters import get_params
 from py_bridge_designer.analysis import Analysis
 from py_bridge_designer.draw import draw_bridge
 
@@ -36,32 +36,62 @@ class Bridge():
             load_scenario_index: int between 0 and 391
         """
         self.error = BridgeError.BridgeNoError
-        self.load_scenario = LoadScenario(load_scenario_index)
+        self.load_scenario = get_load_scenario(load_scenario_index)
 
         # Fill contents of bridge joints from its load scenario
         self.n_joints = self.load_scenario.n_prescribed_joints
         self.joints = []  # type: List[Joint]
         self.joint_coords = dict()
+        # Flat integer grid over the state-matrix coordinate range, holding
+        # the joint's index in self.joints (or -1), so the hot membership
+        # tests in add_member are single array loads instead of tuple hashes
+        self._joint_grid = np.full((256, 256), -1, dtype=np.int32)
         for j in range(self.n_joints):
             joint = self.load_scenario.prescribed_joints[j]
             self.joints.append(joint)
             self.joint_coords[(joint.x, joint.y)] = joint
+            self._grid_insert(joint, j)
 
-        self.parameters = Params()
+        self.parameters = get_params()
+        # CrossSections are immutable value objects with only 198
+        # possible combinations, so reuse them across members
+        self._cross_section_cache = dict()
         self.n_members = 0
         self.members = []  # type: List[Member]
-        self.member_coords = dict()
+        # Set by analyze(); None until the first solve
+        self.analysis = None
+        self._member_arrays = None
+        self._member_buffers = None
+        self._member_capacity = 0
         self.max_y = 32
         self.min_y = -96
         self.matrix_x = 256
         self.matrix_y = 256
         self.max_joints = 128
+        # Per-joint member bookkeeping (indexed by joint number):
+        # degree, and the index of the first member touching the joint
+        self._joint_degree = np.zeros(self.max_joints + 1, dtype=np.int16)
+        self._joint_first_member = np.full(
+            self.max_joints + 1, -1, dtype=np.int32)
+        # SoA joint coordinates (row j holds joint number j + 1), kept
+        # in sync with self.joints so rendering can read every
+        # coordinate with two array slices instead of touching each
+        # Joint object
+        self.joint_x = np.empty(self.max_joints + 1, dtype=np.int32)
+        self.joint_y = np.empty(self.max_joints + 1, dtype=np.int32)
+        for j, joint in enumerate(self.joints):
+            self.joint_x[j] = joint.x
+            self.joint_y[j] = joint.y
         # (self.max_joints + self.load_scenario.n_prescribed_joints) * 2 * 7
         self.state_size = 2048
         self.max_material_types = 3
         self.max_section_types = 2
         self.max_section_size = 33
         self.n_load_instances = 0
+        self.load_instances = None
+        # Incremental load bookkeeping: counts at the last _apply_loads
+        self._applied_n_members = -1
+        self._applied_n_joints = -1
 
         # Setup padding for input and output
         self.pad_x_action = 0
@@ -77,10 +107,39 @@ class Bridge():
         self.max_x_action += self.pad_x_action
         self.max_y_action += self.pad_y_action
 
+        # Joint-bound locals for _add_joint's hot rejection path
+        self._max_joint_x = self.load_scenario.num_length_grids
+        self._max_joint_y = self.load_scenario.over_grids
+        self._min_joint_y = -self.load_scenario.under_grids
+        anchors = self.load_scenario.cable_anchors_x
+        self._cable_anchors = None if anchors is None else frozenset(anchors)
+
     # ===========================================
     # Joints and Members Functions
     # ===========================================
 
+    def _grid_insert(self, joint: Joint, joint_index: int):
+        grid_x = joint.x + 32
+        grid_y = joint.y + 96
+        if 0 <= grid_x < 256 and 0 <= grid_y < 256:
+            self._joint_grid[grid_y, grid_x] = joint_index
+
+    def _joint_at(self, x: int, y: int):
+        """O(1) joint lookup by coordinates, or None.
+
+        Reads the integer grid for in-range coordinates; joints outside
+        the grid (e.g. far cable anchors) fall back to the coordinate
+        dict.
+        Note:
+            Designed by Nathan Hartzler, not ported from the C library
+        """
+        grid_x = x + 32
+        grid_y = y + 96
+        if 0 <= grid_x < 256 and 0 <= grid_y < 256:
+            joint_index = self._joint_grid[grid_y, grid_x]
+            return None if joint_index < 0 else self.joints[joint_index]
+        return self.joint_coords.get((x, y))
+
     def _add_joint(self, coords: Tuple[int, int]) -> Tuple[bool, BridgeError]:
         """Adds a joint to the Bridge. 
         If either the 'start' or 'end' joints are out of bounds, the joint will be rejected.
@@ -101,15 +160,15 @@ class Bridge():
             return False, BridgeError.BridgeAtMaxJoints
 
         # Check if joint coordinates are outside of bounds of the bridge's load scenario
-        # check x
-        if x > self.load_scenario.num_length_grids or x < 0:
-            # Make sure x is not a cable anchor
-            if self.load_scenario.cable_anchors_x is not None and x not in self.load_scenario.cable_anchors_x:
-                # joint rejected
-                return False, BridgeError.BridgeJointOutOfBounds
+        # check x (branchless compare, then the rare cable-anchor probe)
+        if ((x > self._max_joint_x) | (x < 0)) \
+                and self._cable_anchors is not None \
+                and x not in self._cable_anchors:
+            # joint rejected
+            return False, BridgeError.BridgeJointOutOfBounds
 
         # check y
-        if y > self.load_scenario.over_grids or y < -self.load_scenario.under_grids:
+        if (y > self._max_joint_y) | (y < self._min_joint_y):
             # joint rejected
             return False, BridgeError.BridgeJointOutOfBounds
 
@@ -118,6 +177,9 @@ class Bridge():
         joint = Joint(number=self.n_joints, x=x, y=y)
         self.joints.append(joint)
         self.joint_coords[coords] = joint
+        self._grid_insert(joint, self.n_joints - 1)
+        self.joint_x[self.n_joints - 1] = x
+        self.joint_y[self.n_joints - 1] = y
         return True, BridgeError.BridgeJointNotConnected  # joint added
 
     def get_size_of_add_member_parameters(self) -> List[int]:
@@ -165,35 +227,40 @@ class Bridge():
         bridge_error = BridgeError.BridgeNoError
 
         # Enfore that one of the joints must already exist
-        if (start_x, start_y) not in self.joint_coords and (end_x, end_y) not in self.joint_coords:
+        start_joint = self._joint_at(start_x, start_y)
+        end_joint = self._joint_at(end_x, end_y)
+        if start_joint is None and end_joint is None:
             return BridgeError.BridgeJointNotConnected
 
         # Add new joint on either end if needed
-        if not (start_x, start_y) in self.joint_coords:
+        if start_joint is None:
             joint_accepted, bridge_error = self._add_joint(
                 coords=(start_x, start_y))
             if not joint_accepted:
                 # member rejected because of joint
                 return bridge_error
+            start_joint = self.joints[-1]
 
-        elif not (end_x, end_y) in self.joint_coords:
+        elif end_joint is None:
             joint_accepted, bridge_error = self._add_joint(
                 coords=(end_x, end_y))
             if not joint_accepted:
                 # member rejected because of joint
                 return bridge_error
-
-        # Get joints
-        start_joint: Joint = self.joint_coords[(start_x, start_y)]
-        end_joint: Joint = self.joint_coords[(end_x, end_y)]
-
-        # Set Cross Section
-        cross_section = CrossSection(
-            parameters=self.parameters,
-            material_index=material_index,
-            section=section_index,
-            size=size
-        )
+            end_joint = self.joints[-1]
+
+        # Set Cross Section (memoized: only 198 distinct combinations)
+        cross_section = self._cross_section_cache.get(
+            (material_index, section_index, size))
+        if cross_section is None:
+            cross_section = CrossSection(
+                parameters=self.parameters,
+                material_index=material_index,
+                section=section_index,
+                size=size
+            )
+            self._cross_section_cache[
+                (material_index, section_index, size)] = cross_section
 
         # Add the member
         self.n_members += 1
@@ -205,52 +272,141 @@ class Bridge():
             grid_size=self.load_scenario.grid_size
         )
         self.members.append(member)
-        self.member_coords[start_joint.number] = end_joint.number
-        self.member_coords[end_joint.number] = start_joint.number
+        self._append_member_arrays(member)
+        member_index = self.n_members - 1
+        self._joint_degree[start_joint.number] += 1
+        self._joint_degree[end_joint.number] += 1
+        if self._joint_first_member[start_joint.number] < 0:
+            self._joint_first_member[start_joint.number] = member_index
+        if self._joint_first_member[end_joint.number] < 0:
+            self._joint_first_member[end_joint.number] = member_index
 
         return bridge_error
 
+    def add_member_batch(self, actions) -> np.ndarray:
+        """Adds many members in one call.
+
+        Amortizes the per-call overhead when a driver (e.g. a vectorized
+        env or a scripted builder) already has its actions batched.
+
+        Args:
+            actions: (N, 7) array-like of add_member argument rows
+        Returns:
+            (N,) int32 ndarray of BridgeError codes, one per row
+        Note:
+            Designed by Nathan Hartzler, not ported from the C library
+        """
+        actions = np.asarray(actions)
+        errors = np.empty(len(actions), dtype=np.int32)
+        add_member = self.add_member
+        for i, row in enumerate(actions.tolist()):
+            errors[i] = add_member(*row)
+        return errors
+
+    def _append_member_arrays(self, member: Member):
+        """Append one member's row to the structure-of-arrays buffers.
+
+        The buffers are preallocated and grown by doubling, so adding a
+        member costs a handful of scalar writes instead of a full
+        rebuild at the next analysis.
+        Note:
+            Designed by Nathan Hartzler, not ported from the C library
+        """
+        if self.n_members > self._member_capacity:
+            self._grow_member_buffers()
+        buffers = self._member_buffers
+        m = member.number - 1
+        cross_section = member.cross_section
+        parameters = self.parameters
+        buffers['j1'][m] = member.start_joint.number
+        buffers['j2'][m] = member.end_joint.number
+        buffers['cos_x'][m] = member.cos_x
+        buffers['cos_y'][m] = member.cos_y
+        buffers['length'][m] = member.length
+        buffers['area'][m] = parameters.shape_area_table[
+            cross_section.section, cross_section.size]
+        buffers['moment'][m] = parameters.shape_moment_table[
+            cross_section.section, cross_section.size]
+        buffers['E'][m] = cross_section.material.E
+        buffers['Fy'][m] = cross_section.material.Fy
+        buffers['density'][m] = cross_section.material.density
+        buffers['actions'][m] = (member.start_joint.x, member.start_joint.y,
+                                 member.end_joint.x, member.end_joint.y,
+                                 cross_section.material_index,
+                                 cross_section.section, cross_section.size)
+        # Trimmed views are per member count, so drop the cached dict
+        self._member_arrays = None
+
+    def _grow_member_buffers(self):
+        capacity = max(64, self._member_capacity * 2)
+        buffers = {
+            'j1': np.empty(capacity, dtype=np.intp),
+            'j2': np.empty(capacity, dtype=np.intp),
+            'cos_x': np.empty(capacity, dtype=np.float64),
+            'cos_y': np.empty(capacity, dtype=np.float64),
+            'length': np.empty(capacity, dtype=np.float64),
+            'area': np.empty(capacity, dtype=np.float64),
+            'moment': np.empty(capacity, dtype=np.float64),
+            'E': np.empty(capacity, dtype=np.float64),
+            'Fy': np.empty(capacity, dtype=np.float64),
+            'density': np.empty(capacity, dtype=np.float64),
+            'actions': np.empty((capacity, 7), dtype=np.int32),
+        }
+        if self._member_buffers is not None:
+            filled = self.n_members - 1
+            for key, buffer in buffers.items():
+                buffer[:filled] = self._member_buffers[key][:filled]
+        self._member_capacity = capacity
+        self._member_buffers = buffers
+
+    def _precompute_member_arrays(self) -> dict:
+        """Return per-member structure-of-arrays views for analysis.
+
+        The rows are maintained incrementally by add_member; this just
+        trims the preallocated buffers to the current member count and
+        caches the resulting views, since members are append-only.
+        Note:
+            Designed by Nathan Hartzler, not ported from the C library
+        """
+        cache = self._member_arrays
+        if cache is not None and cache['n_members'] == self.n_members:
+            return cache
+
+        n_members = self.n_members
+        buffers = self._member_buffers
+        arrays = {'n_members': n_members}
+        for key in ('j1', 'j2', 'cos_x', 'cos_y', 'length',
+                    'area', 'moment', 'E', 'Fy', 'density'):
+            if buffers is None:
+                arrays[key] = np.empty(0, dtype=np.float64)
+            else:
+                arrays[key] = buffers[key][:n_members]
+        arrays['ae_over_l'] = arrays['area'] * arrays['E'] / arrays['length']
+        self._member_arrays = arrays
+        return arrays
+
     # ===========================================
     # Observation Functions
     # ===========================================
 
-    def _zeros(self) -> List[List[int]]:
-        zeros = []
-        for _ in range(self.matrix_y):
-            row = []
-            for _ in range(self.matrix_x):
-                row.append(0)
-            zeros.append(row)
-        return zeros
-
-    def _get_vecV1_state(self) -> List[int]:
+    def _get_vecV1_state(self) -> np.ndarray:
         """Get the current state of the bridge as a 1D Vector
         Returns:
             A (1 x 2048) vector with added Members in the form of their 1 x 7 action such as: 16, 0, 24, 16, 0, 0, 18
         Note:
             Designed by Nathan Hartzler, not ported from the C library
         """
-        state = []
-
-        for member in self.members:
-            state += [
-                member.start_joint.x,
-                member.start_joint.y,
-                member.end_joint.x,
-                member.end_joint.y,
-                member.cross_section.material_index,
-                member.cross_section.section,
-                member.cross_section.size]
-        if len(state) > self.state_size:
-            state = state[:self.state_size]
-        else:
-            # fill in rest of the observation vector with -1
-            while len(state) < self.state_size:
-                state.append(-1)
+        # Member rows are already maintained as a (n_members, 7) buffer,
+        # so the vector is one copy into a -1-filled observation
+        state = np.full(self.state_size, -1, dtype=np.int32)
+        if self.n_members > 0:
+            rows = self._member_buffers['actions'][:self.n_members].ravel()
+            n_filled = min(rows.size, self.state_size)
+            state[:n_filled] = rows[:n_filled]
 
         return state
 
-    def _get_vecV2_state(self) -> List[int]:
+    def _get_vecV2_state(self) -> np.ndarray:
         """Get the current state of the bridge as a 1D Vector
         Returns:
             A (1 x 2048) vector with added Members in the form of their 1 x 7 action such as: 16, 0, 24, 16, 0, 0, 18
@@ -266,12 +422,13 @@ class Bridge():
             if self.n_members == 0:
                 # Return list of initial joints
                 state += unconnected_joint
-            elif joint.number not in self.member_coords:
+            elif self._joint_degree[joint.number] == 0:
                 # Joint present but not yet used
                 state += unconnected_joint
             else:
                 if joint.number not in joints_added:
-                    member: Member = self.member_coords[joint.number]
+                    member: Member = self.members[
+                        self._joint_first_member[joint.number]]
                     state += [
                         member.start_joint.x,
                         member.start_joint.y,
@@ -282,28 +439,23 @@ class Bridge():
                         member.cross_section.size]
                     joints_added[joint.number] = True
 
-        for member in self.members:
-            state += [
-                member.start_joint.x,
-                member.start_joint.y,
-                member.end_joint.x,
-                member.end_joint.y,
-                member.cross_section.material_index,
-                member.cross_section.section,
-                member.cross_section.size]
-        if len(state) > self.state_size:
-            state = state[:self.state_size]
-        else:
-            # fill in rest of the observation vector with -1
-            while len(state) < self.state_size:
-                state.append(-1)
+        buf = np.full(self.state_size, -1, dtype=np.int32)
+        prefix = np.asarray(state, dtype=np.int32)[:self.state_size]
+        buf[:prefix.size] = prefix
+        if self.n_members > 0 and prefix.size < self.state_size:
+            rows = self._member_buffers['actions'][:self.n_members].ravel()
+            n_filled = min(rows.size, self.state_size - prefix.size)
+            buf[prefix.size:prefix.size + n_filled] = rows[:n_filled]
 
-        return state
+        return buf
 
-    def get_state(self) -> List[List[List[int]]]:
+    def get_state(self, out: np.ndarray = None) -> np.ndarray:
         """Get the current state of the bridge as a 3D adjacency tensor
+        Args:
+            out: optional preallocated int8 array of shape
+                (2, self.matrix_y, self.matrix_x) to fill in place
         Returns:
-            An adjacency tensor in the shape (2, self.matrix_y, self.matrix_x) with values {0,1}
+            An int8 ndarray in the shape (2, self.matrix_y, self.matrix_x) with values {0,1}
             1st matrix representing the joint coordinates
                 - 1 if a joint exists at that (x,y) position and 0 otherwise
             2nd matrix representing the member connections
@@ -313,29 +465,26 @@ class Bridge():
             Designed by Nathan Hartzler, not ported from the C library
         """
 
-        coord_matrix = self._zeros()  # initialize the 1st matrix to all zeros
-        match_count = 0
-        for y in range(self.matrix_y):
-            for x in range(self.matrix_x):
-                # Convert adjacency index values to coordinate values
-                x_coord = x - 32
-                y_coord = y - 96
-                if (x_coord, y_coord) in self.joint_coords:
-                    # Use adjacency index values
-                    coord_matrix[y][x] = 1
-
-        member_matrix = self._zeros()
-        for i in range(self.max_joints):
-            joint_number = i + 1
-            if joint_number in self.member_coords:
-                # Adjust the 1-based joint_numbers for the 0-based matrix index
-                start_joint = joint_number - 1
-                end_joint = self.member_coords[joint_number] - 1
-                # Add the adjacency numbers
-                member_matrix[start_joint][end_joint] = 1
-                member_matrix[end_joint][start_joint] = 1
-
-        return [coord_matrix, member_matrix]
+        if out is None:
+            out = np.empty((2, self.matrix_y, self.matrix_x), dtype=np.int8)
+        coord_matrix = out[0]
+        member_matrix = out[1]
+
+        # The joint grid already marks occupied cells over exactly the
+        # state-matrix coordinate range, so the coord matrix is one
+        # comparison over it
+        coord_matrix[:] = self._joint_grid != -1
+
+        member_matrix[:] = 0
+        if self.n_members > 0:
+            # Adjust the 1-based joint_numbers for the 0-based matrix index
+            arrays = self._precompute_member_arrays()
+            start_joints = arrays['j1'] - 1
+            end_joints = arrays['j2'] - 1
+            member_matrix[start_joints, end_joints] = 1
+            member_matrix[end_joints, start_joints] = 1
+
+        return out
 
     # ===========================================
     # Analysis Functions
@@ -344,75 +493,94 @@ class Bridge():
     def _setup_load_instances(self):
         self.n_equations = self.n_joints * 2
         self.n_load_instances = self.load_scenario.n_loaded_joints + 1
-        self.load_instances: List[List[float]] = []
-        for _ in range(self.n_load_instances + 1):
-            point_load: List[float] = []
-            for _ in range(self.n_equations + 1):
-                point_load.append(0.0)
-            self.load_instances.append(point_load)
-
-    def _apply_self_weights(self):
-        for member in self.members:
-            dead_load: float = self.parameters.dead_load_factor * \
-                self.parameters.shapes[member.cross_section.section][member.cross_section.size].area * \
-                member.length * member.cross_section.material.density * \
-                9.8066 / 2.0 / 1000.0
-
-            force_point_1 = 2 * member.start_joint.number
-            force_point_2 = 2 * member.end_joint.number
-
-            for point_load in self.load_instances:
-                point_load[force_point_1] -= dead_load
-                point_load[force_point_2] -= dead_load
+        # 2-D float64 buffer, row per load instance, column per equation
+        self.load_instances = np.zeros(
+            (self.n_load_instances, self.n_equations), dtype=np.float64)
+
+    def _apply_member_weights(self, first_member=0):
+        """Subtract self-weight of members[first_member:] from every
+        load instance.
+
+        Called with the previously applied member count to add just the
+        delta contribution when analyze() runs again on a grown bridge.
+        """
+        factor = self.parameters.dead_load_factor * 9.8066 / 2.0 / 1000.0
+        arrays = self._precompute_member_arrays()
+        new_members = slice(first_member, None)
+        dead_loads = factor * arrays['area'][new_members] * \
+            arrays['length'][new_members] * arrays['density'][new_members]
+        force_points = np.empty(2 * dead_loads.size, dtype=np.intp)
+        force_points[0::2] = 2 * arrays['j1'][new_members] - 1
+        force_points[1::2] = 2 * arrays['j2'][new_members] - 1
+
+        column_totals = np.zeros(self.n_equations, dtype=np.float64)
+        np.add.at(column_totals, force_points, np.repeat(dead_loads, 2))
+        self.load_instances -= column_totals
 
     def _apply_dead_load(self):
+        """Subtract the deck's point dead load from every load instance
+        in one broadcast pass."""
+        column_totals = np.zeros(self.n_equations, dtype=np.float64)
+
         load_scenario = self.load_scenario
         load_case = self.parameters.load_cases[load_scenario.load_case]
-
-        for joint in self.joints:
-            force_point = 2 * joint.number
-            for point_load in self.load_instances:
-                load = load_case.point_dead_load
-                # Account for the ends of the bridge deck
-                if (joint.number == 1 or joint.number == load_scenario.n_loaded_joints):
-                    load /= 2  # divide load by 2
-                point_load[force_point] -= load
+        joint_numbers = np.array(
+            [joint.number for joint in self.joints], dtype=np.intp)
+        loads = np.full(len(joint_numbers),
+                        load_case.point_dead_load, dtype=np.float64)
+        # Account for the ends of the bridge deck
+        deck_ends = (joint_numbers == 1) | (
+            joint_numbers == load_scenario.n_loaded_joints)
+        loads[deck_ends] /= 2  # divide load by 2
+        column_totals[2 * joint_numbers - 1] += loads
+
+        self.load_instances -= column_totals
 
     def _apply_live_load(self):
         load_case = self.parameters.load_cases[self.load_scenario.load_case]
-        for i in range(2, self.n_load_instances):
-            point_load = self.load_instances[i]
-            force_point_front = 2 * i
-            force_point_rear = force_point_front - 2
-            point_load[force_point_front] -= self.parameters.live_load_factor * \
-                load_case.front_axle_load
-            point_load[force_point_rear] -= self.parameters.live_load_factor * \
-                load_case.rear_axle_load
-
-    def _apply_loads(self, test_print=False):
-        self._setup_load_instances()
-        self._apply_self_weights()
-        self._apply_dead_load()
-        self._apply_live_load()
+        instance_numbers = np.arange(2, self.n_load_instances)
+        force_points_front = 2 * instance_numbers - 1
+        self.load_instances[instance_numbers - 1, force_points_front] -= \
+            self.parameters.live_load_factor * load_case.front_axle_load
+        self.load_instances[instance_numbers - 1, force_points_front - 2] -= \
+            self.parameters.live_load_factor * load_case.rear_axle_load
+
+    def _apply_loads(self, test_print=False, recompute_all=False):
+        # Members and joints are append-only, so if the joint count is
+        # unchanged the equations are the same and only the new members'
+        # self-weight needs to be folded in; otherwise rebuild fully.
+        incremental = not recompute_all and \
+            self._applied_n_joints == self.n_joints and \
+            self.load_instances is not None
+        if incremental:
+            if self._applied_n_members != self.n_members:
+                self._apply_member_weights(self._applied_n_members)
+        else:
+            self._setup_load_instances()
+            self._apply_member_weights()
+            self._apply_dead_load()
+            self._apply_live_load()
+            self._applied_n_joints = self.n_joints
+        self._applied_n_members = self.n_members
 
         if test_print:
-            for i in range(1, self.n_load_instances + 1):
+            for i in range(self.n_load_instances):
                 point_load = self.load_instances[i]
-                print("Point Loads Load Case", i)
+                print("Point Loads Load Case", i + 1)
                 print("Jnt #      X           Y")
                 print("----- ----------- -----------")
                 for joint in self.joints:
                     print("%5d %11.5f %11.5f" % (
-                        joint.number, point_load[2 * joint.number - 1], point_load[2 * joint.number]))
+                        joint.number, point_load[2 * joint.number - 2], point_load[2 * joint.number - 1]))
 
-    def analyze(self, test_print=False) -> Tuple[bool, int]:
+    def analyze(self, test_print=False, dtype=np.float64) -> Tuple[bool, int]:
         if self.n_members == 0:
             return False, 0.0
 
         self._apply_loads(test_print)
-        self.analysis = Analysis(bridge=self, test_print=test_print)
+        self.analysis = Analysis(bridge=self, test_print=test_print, dtype=dtype)
         valid, cost = self.analysis.get_results()
         return valid, cost
 
-    def get_image(self):
-        return draw_bridge(self)
+    def get_image(self, output_shape=None):
+        return draw_bridge(self, output_shape=output_shape)
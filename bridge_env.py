@@ -14,11 +14,35 @@ from py_bridge_designer.bridge import Bridge, BridgeError
 class BridgeEnv(gym.Env):
     metadata = {"render_modes": ["rgb_array"], "render_fps": 30}
 
+    # Reward dispatch per bridge error: (kind, value, episode complete).
+    # "scaled" multiplies the cost-based reward by value, "const"
+    # returns value directly.
+    _ERROR_REWARDS = {
+        BridgeError.BridgeAtMaxJoints: ("scaled", 10, True),
+        BridgeError.BridgeJointOutOfBounds: ("const", -40, False),
+        BridgeError.BridgeJointsAreEqual: ("const", -40, False),
+        BridgeError.BridgeJointNotConnected: ("const", -2, False),
+    }
+
     def __init__(self, render_mode=None, load_scenario_index=None, test_print=False):
         self.reward_range = (-np.inf, 0)
         assert render_mode is None or render_mode in self.metadata["render_modes"]
         self.render_mode = render_mode
         self.test_print = test_print
+        self._rng = np.random.default_rng()
+        # A scenario index given to the constructor stays pinned across
+        # bare reset() calls: the action-space bounds depend on the
+        # scenario, so vectorized stacks need every sub-env to keep the
+        # same index when autoreset passes no index. Constructing with
+        # None keeps the old behavior (a fresh random scenario each
+        # reset).
+        self._pinned_scenario_index = load_scenario_index
+        # Spaces rebuilt in reset() are cached per scenario index
+        self._spaces_cache = dict()
+        # Memoized analyze() results keyed by (scenario, topology hash);
+        # identical partial bridges recur constantly across episodes
+        self._analyze_cache = dict()
+        self._topo_hash = 0
 
         # Select a random load_scenario_index if needed
         if load_scenario_index is None:
@@ -28,9 +52,15 @@ class BridgeEnv(gym.Env):
 
         # Init the bridge
         self.bridge = Bridge(self.load_scenario_index)
+        # Observation buffer reused across steps to avoid per-step
+        # allocation; get_state fills it in place
+        self._obs_buffer = np.empty(
+            (2, self.bridge.matrix_y, self.bridge.matrix_x), dtype=np.int8)
 
-        # Define action space
+        # Define action space (sizes are fixed per bridge, cache them
+        # for the per-step clip)
         action_size = self.bridge.get_size_of_add_member_parameters()
+        self._sizes_minus_one = np.asarray(action_size, dtype=np.int16) - 1
 
         self.action_space = spaces.Box(
             low=min(action_size),
@@ -42,61 +72,65 @@ class BridgeEnv(gym.Env):
         self.observation_space = spaces.Box(
             low=0,
             high=1,
-            shape=self._get_observation().shape,
+            shape=(self._obs_buffer.size,),
             dtype=np.int8)
 
+        self._scenario_id = self.bridge.load_scenario.desc.id
+        self._scenario_site_cost = self.bridge.load_scenario.desc.site_cost
+
     def _rand_load_scenario_index(self) -> int:
-        # return int(self.np_random.uniform(low=0, high=392))
-        # trying without seeded rng
-        return int(np.random.uniform(low=0, high=392))
+        return int(self._rng.integers(0, 392))
 
     @staticmethod
     def _calculate_reward(bridge_valid: bool,
                           bridge_error: BridgeError,
                           bridge_cost: int) -> Tuple[float, bool]:
 
-        _reward = round(-(bridge_cost * .000001), 4)
+        # Common path first: no error on the last add_member. The
+        # cost-based reward is only computed on the branches that use it
         if bridge_error == BridgeError.BridgeNoError:
             if bridge_valid:
-                complete = True
-                return _reward, complete
-            else:
-                complete = False
-                return 1, complete
-        elif bridge_error == BridgeError.BridgeAtMaxJoints:
-            complete = True
-            penalty = 10
-            return _reward * penalty, complete
-        elif bridge_error == BridgeError.BridgeJointOutOfBounds or bridge_error == BridgeError.BridgeJointsAreEqual:
-            complete = False
-            return -40, complete
-        elif bridge_error == BridgeError.BridgeJointNotConnected:
-            complete = False
-            return -2, complete
-        else:
-            complete = True
-            print("Error! Unknown BridgeError type in _calculate_reward")
-            penalty = 10
-            return -bridge_cost * penalty, complete
+                return round(-(bridge_cost * .000001), 4), True
+            return 1, False
+
+        kind, value, complete = BridgeEnv._ERROR_REWARDS.get(
+            bridge_error, ("unknown", 10, True))
+        if kind == "scaled":
+            return round(-(bridge_cost * .000001), 4) * value, complete
+        if kind == "const":
+            return value, complete
+        print("Error! Unknown BridgeError type in _calculate_reward")
+        return -bridge_cost * value, complete
 
     def _get_observation(self):
-        """This should not be called before reset()"""
-        obs = np.array(self.bridge.get_state(), dtype=np.int8)
-        return np.reshape(obs, (np.prod(obs.shape),))
+        """This should not be called before reset().
+
+        Returns:
+            A flat int8 view of the shared observation buffer. It is
+            overwritten in place by the next step()/reset(), so
+            consumers that keep observations across steps (e.g. a
+            replay buffer) must .copy() them.
+        """
+        obs = self.bridge.get_state(out=self._obs_buffer)
+        return obs.reshape(-1)
 
     def _get_info(self, current_error=BridgeError.BridgeNoError, bridge_valid=False):
         """This should not be called before reset()"""
         return {
-            "scenario_id": self.bridge.load_scenario.desc.id,
-            "scenario_site_cost": self.bridge.load_scenario.desc.site_cost,
+            "scenario_id": self._scenario_id,
+            "scenario_site_cost": self._scenario_site_cost,
             "current_error": current_error,
             "bridge_valid": bridge_valid
         }
 
     def reset(self, seed=None, load_scenario_index=None, options=None):
         super().reset(seed=seed)
+        if seed is not None:
+            self._rng = np.random.default_rng(seed)
 
-        # Select a random load_scenario_index if needed
+        # Fall back to the pinned index, then to a random scenario
+        if load_scenario_index is None:
+            load_scenario_index = self._pinned_scenario_index
         if load_scenario_index is None:
             self.load_scenario_index = self._rand_load_scenario_index()
         else:
@@ -104,24 +138,40 @@ class BridgeEnv(gym.Env):
 
         # Init the bridge
         self.bridge = Bridge(self.load_scenario_index)
+        self._obs_buffer = np.empty(
+            (2, self.bridge.matrix_y, self.bridge.matrix_x), dtype=np.int8)
 
-        # Define action space
+        # Define action and observation spaces; dimensions only depend
+        # on the scenario, so reuse previously built spaces when the
+        # index repeats
         action_size = self.bridge.get_size_of_add_member_parameters()
-
-        self.action_space = spaces.Box(
-            low=0,
-            high=max(action_size),
-            shape=(len(action_size),),
-            dtype=np.float32,
-            seed=seed)
-
-        # Define observation space
-        self.observation_space = spaces.Box(
-            low=0,
-            high=1,
-            shape=self._get_observation().shape,
-            dtype=np.int8,
-            seed=seed)
+        self._sizes_minus_one = np.asarray(action_size, dtype=np.int16) - 1
+
+        # Scenario identity/site cost are invariant for the episode
+        self._scenario_id = self.bridge.load_scenario.desc.id
+        self._scenario_site_cost = self.bridge.load_scenario.desc.site_cost
+        self._topo_hash = 0
+
+        cached = self._spaces_cache.get(self.load_scenario_index)
+        if cached is None:
+            self.action_space = spaces.Box(
+                low=0,
+                high=max(action_size),
+                shape=(len(action_size),),
+                dtype=np.float32,
+                seed=seed)
+            self.observation_space = spaces.Box(
+                low=0,
+                high=1,
+                shape=(self._obs_buffer.size,),
+                dtype=np.int8,
+                seed=seed)
+            self._spaces_cache[self.load_scenario_index] = (
+                self.action_space, self.observation_space)
+        else:
+            self.action_space, self.observation_space = cached
+            self.action_space.seed(seed)
+            self.observation_space.seed(seed)
 
         # Return the observation and info
         observation = self._get_observation()
@@ -130,20 +180,52 @@ class BridgeEnv(gym.Env):
         return observation, info
 
     def _clip_action(self, action):
-        sizes = self.bridge.get_size_of_add_member_parameters()
-        new_action = []
-        for i in range(len(sizes)):
-            max_x = sizes[i]
-            x = int(action[i])
-            new_action.append(x if x < max_x else max_x - 1)
-        return new_action
+        clipped = np.minimum(np.asarray(action, dtype=np.int16),
+                             self._sizes_minus_one)
+        # Plain Python ints splat into add_member faster than ndarray
+        # scalar extraction per argument
+        return tuple(clipped.tolist())
+
+    # Rejections whose rewards never read the analysis result, so the
+    # solve can be skipped for them in step(). BridgeJointNotConnected
+    # is also returned by add_member when a member *was* appended via a
+    # freshly created joint, so membership here is only meaningful
+    # together with an unchanged member count.
+    _SKIP_ANALYZE_ERRORS = frozenset((
+        BridgeError.BridgeJointOutOfBounds,
+        BridgeError.BridgeJointsAreEqual,
+        BridgeError.BridgeJointNotConnected,
+    ))
 
     def step(self, action):
         action = self._clip_action(action)
-        bridge_error = self.bridge.add_member(
-            action[0], action[1], action[2], action[3], action[4], action[5], action[6])
-
-        bridge_valid, bridge_cost = self.bridge.analyze(self.test_print)
+        n_members_before = self.bridge.n_members
+        bridge_error = self.bridge.add_member(*action)
+        member_added = self.bridge.n_members != n_members_before
+
+        if not member_added and bridge_error in self._SKIP_ANALYZE_ERRORS:
+            # The member was genuinely rejected, the bridge is unchanged
+            # and the reward for these errors is a constant
+            bridge_valid, bridge_cost = False, 0
+        else:
+            # Fold the action into the rolling topology hash only when
+            # a member was actually appended, so the hash identifies
+            # the bridge topology, then reuse a previous analysis of
+            # the same partial bridge. Disabled when rendering, which
+            # reads bridge.analysis.
+            if member_added:
+                self._topo_hash = hash((self._topo_hash, action))
+            cache_key = (self.load_scenario_index, self._topo_hash)
+            cached = self._analyze_cache.get(cache_key)
+            if cached is not None and self.render_mode is None:
+                bridge_valid, bridge_cost = cached
+            else:
+                bridge_valid, bridge_cost = self.bridge.analyze(
+                    self.test_print)
+                if len(self._analyze_cache) >= 4096:
+                    # Bounded: drop the oldest entry
+                    self._analyze_cache.pop(next(iter(self._analyze_cache)))
+                self._analyze_cache[cache_key] = (bridge_valid, bridge_cost)
         reward, terminated = self._calculate_reward(
             bridge_valid, bridge_error, bridge_cost)
 
@@ -10,30 +10,32 @@ by Gene K. Ressler
 
 """
 from __future__ import annotations
-from typing import TYPE_CHECKING, List
+from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from py_bridge_designer.bridge import Bridge
-    from py_bridge_designer.members import CrossSection
 
 
 def calculate_cost(bridge: Bridge) -> int:
-    used: List[CrossSection] = []
+    shapes = bridge.parameters.shapes
+    # Per cross-section factors, memoized with the CrossSection itself
+    # as key (hash/eq cover the same fields is_equal compares). Stores
+    # (cost * area, density) so the accumulation below multiplies in
+    # the original order.
+    xs_factors = {}
     mtl_cost = 0.00
     for member in bridge.members:
         xs = member.cross_section
-        mtl_cost += xs.material.cost[xs.section] * \
-            bridge.parameters.shapes[xs.section][xs.size].area * \
-            member.length * xs.material.density
-
-        # Look for this cross-section in the list of those already used
-        found = sum([1 if not xs.is_equal(used[i])
-                    else 0 for i in range(len(used))])
-        if found == len(used):
-            # Didn't find this cross-section.  Add it.
-            used.append(xs)
-
-    product_cost = len(used) * bridge.parameters.ordering_fee
+        factors = xs_factors.get(xs)
+        if factors is None:
+            factors = (xs.material.cost[xs.section] *
+                       shapes[xs.section][xs.size].area,
+                       xs.material.density)
+            xs_factors[xs] = factors
+        cost_area, density = factors
+        mtl_cost += cost_area * member.length * density
+
+    product_cost = len(xs_factors) * bridge.parameters.ordering_fee
     connection_cost = bridge.n_joints * bridge.parameters.connection_cost
     total_cost = 2 * (mtl_cost + connection_cost) + \
         product_cost + bridge.load_scenario.desc.site_cost
@@ -10,7 +10,7 @@ by Gene K. Ressler
 
 """
 from __future__ import annotations
-from typing import TYPE_CHECKING, Tuple
+from typing import TYPE_CHECKING
 import cv2
 import numpy as np
 from py_bridge_designer.scenario import CABLE_SUPPORT_LEFT, CABLE_SUPPORT_BOTH, CABLE_ANCHORAGE_X_OFFSET
@@ -25,33 +25,42 @@ SKETCH_MARGIN = 10
 # Number of pixels in a single bridge designer grid.
 SKETCH_GRID_SIZE = 16
 
-MAX_NOFORCE_R, MAX_NOFORCE_G, MAX_NOFORCE_B = 192, 192, 192
-MAX_TENSION_R, MAX_TENSION_G, MAX_TENSION_B = 0, 0, 255
-MAX_COMPRESSION_R, MAX_COMPRESSION_G, MAX_COMPRESSION_B = 255, 0, 0
+MAX_NOFORCE_RGB = np.array([192, 192, 192], dtype=np.float64)
+MAX_TENSION_RGB = np.array([0, 0, 255], dtype=np.float64)
+MAX_COMPRESSION_RGB = np.array([255, 0, 0], dtype=np.float64)
+SLENDER_FAIL_RGB = np.array([255, 0, 255], dtype=np.int32)
 
+# Reusable image buffers keyed by output size, so a render loop does
+# not allocate ~1.8 MB per frame
+_image_cache = {}
 
-def _set_intensity(intensity: float) -> float:
-    if intensity < 0:
-        return 0.0
-    elif intensity > 1:
-        return 1.0
-    else:
-        return intensity
 
+def _member_colors(bridge: Bridge) -> np.ndarray:
+    """Computes the (n_members, 3) RGB color table in one vectorized pass."""
+    n_members = bridge.n_members
+    if bridge.analysis is None:
+        return np.full((n_members, 3), 255, dtype=np.int32)
 
-def _set_color(intensity: float, max_type: str) -> Tuple[int, int, int]:
-    _intensity = _set_intensity(intensity)
+    strength = bridge.analysis.member_strength
+    forces = bridge.analysis.max_forces
+    compression_intensity = np.divide(forces.compression, strength.compressive,
+                                      out=np.zeros(n_members),
+                                      where=strength.compressive > 0)
+    tension_intensity = np.divide(forces.tension, strength.tensile,
+                                  out=np.zeros(n_members),
+                                  where=strength.tensile > 0)
 
-    if max_type == 'tension':
-        max_r, max_g, max_b = MAX_TENSION_R, MAX_TENSION_G, MAX_TENSION_B
-    else:
-        max_r, max_g, max_b = MAX_COMPRESSION_R, MAX_COMPRESSION_G, MAX_COMPRESSION_B
+    use_compression = compression_intensity > tension_intensity
+    intensity = np.clip(np.where(use_compression,
+                                 compression_intensity,
+                                 tension_intensity), 0.0, 1.0)[:, None]
+    max_rgb = np.where(use_compression[:, None],
+                       MAX_COMPRESSION_RGB, MAX_TENSION_RGB)
+    colors = (max_rgb * intensity +
+              MAX_NOFORCE_RGB * (1.0 - intensity)).astype(np.int32)
 
-    r = int(max_r * _intensity + MAX_NOFORCE_R * (1.0 - _intensity))
-    g = int(max_g * _intensity + MAX_NOFORCE_G * (1.0 - _intensity))
-    b = int(max_b * _intensity + MAX_NOFORCE_B * (1.0 - _intensity))
-
-    return r, g, b
+    slender = strength.compressive_fail_mode == FailMode.FailModeSlenderness
+    return np.where(slender[:, None], SLENDER_FAIL_RGB, colors)
 
 
 def _orient_x_pixel(x_org_pixel: int, grid_pixels: float, position: float) -> int:
@@ -62,12 +71,29 @@ def _orient_y_pixel(y_org_pixel: int, grid_pixels: float, under_grids: int, posi
     return y_org_pixel + int((position + under_grids) * grid_pixels)
 
 
-def draw_bridge(bridge: Bridge, width=850, height=700, line_thickness=2):
+def draw_bridge(bridge: Bridge, width=850, height=700, line_thickness=2,
+                output_shape=None):
     """
+    Args:
+        output_shape: optional (height, width) tuple to render at
+            directly, e.g. a compact observation-sized raster for an
+            RL agent. Overrides width/height. Drawing cost scales with
+            pixels touched, so small shapes render proportionally
+            faster than rendering large and resizing down.
     Returns:
-        NDArray[unint8] with size (height, width, 3)
+        NDArray[unint8] with size (height, width, 3).
+        The array is a shared buffer, only valid until the next
+        draw_bridge call with the same size; callers that keep frames
+        must .copy()
     """
-    image = np.zeros(shape=(height, width, 3), dtype=np.uint8)
+    if output_shape is not None:
+        height, width = output_shape
+
+    image = _image_cache.get((height, width))
+    if image is None:
+        image = np.empty(shape=(height, width, 3), dtype=np.uint8)
+        _image_cache[(height, width)] = image
+    image.fill(0)
 
     # Setup the variables
     bridge_width_grids = bridge.load_scenario.num_length_grids
@@ -87,13 +113,25 @@ def draw_bridge(bridge: Bridge, width=850, height=700, line_thickness=2):
                                 bridge_right_anchor_margin) * grid_pixels) / 2.0)
     y_org_pixel = int((height - bridge_height_grids * grid_pixels) / 2.0)
 
+    # Draw directly in the rotated frame (the sketch is flipped 180
+    # degrees on output), saving a full-image rotation pass at the end
     def sketch_x(x: float):
-        return _orient_x_pixel(x_org_pixel, grid_pixels, x)
+        return width - 1 - _orient_x_pixel(x_org_pixel, grid_pixels, x)
 
     def sketch_y(y: float):
-        return _orient_y_pixel(
+        return height - 1 - _orient_y_pixel(
             y_org_pixel, grid_pixels, bridge.load_scenario.under_grids, y)
 
+    # Convert every joint coordinate to pixels in one vectorized pass,
+    # indexed below by joint number
+    joint_x = bridge.joint_x[:bridge.n_joints]
+    joint_y = bridge.joint_y[:bridge.n_joints]
+    pix_x = (width - 1 - (x_org_pixel + (joint_x * grid_pixels)
+                          .astype(np.int32))).tolist()
+    pix_y = (height - 1 - (y_org_pixel +
+                           ((joint_y + bridge.load_scenario.under_grids)
+                            * grid_pixels).astype(np.int32))).tolist()
+
     # Draw the build area
     cv2.rectangle(
         image,
@@ -106,49 +144,42 @@ def draw_bridge(bridge: Bridge, width=850, height=700, line_thickness=2):
     # Draw the prescribed joints
     for j in bridge.load_scenario.prescribed_joints:
         cv2.circle(image,
-                   center=(sketch_x(j.x), sketch_y(j.y)),
+                   center=(pix_x[j.number - 1], pix_y[j.number - 1]),
                    radius=line_thickness + 3,
                    color=(127, 127, 127),
                    thickness=line_thickness - 1)
 
+    member_colors = _member_colors(bridge).tolist()
+
+    # Bucket member lines by color so each color is a single polylines
+    # call, and collect one color per joint instead of drawing each
+    # joint once per incident member
+    segments_by_color = {}
+    joint_colors = {}
     for member in bridge.members:
         j1 = member.start_joint
         j2 = member.end_joint
-        r, g, b = 255, 255, 255
-
-        if bridge.analysis is not None:
-            if bridge.analysis.member_strength[member.number].compressive_fail_mode == FailMode.FailModeSlenderness:
-                r, g, b = 255, 0, 255
-            else:
-                compressive = bridge.analysis.member_strength[member.number].compressive
-                compression_intensity = bridge.analysis.max_forces[
-                    member.number].compression / compressive if compressive > 0 else 0
-
-                tensile = bridge.analysis.member_strength[member.number].tensile
-                tension_intensity = bridge.analysis.max_forces[member.number].tension / \
-                    tensile if tensile > 0 else 0
-
-                if compression_intensity > tension_intensity:
-                    r, g, b = _set_color(compression_intensity, 'compression')
-                else:
-                    r, g, b = _set_color(tension_intensity, 'tension')
-        # Draw joints
+        color = tuple(member_colors[member.number - 1])
+        p1 = (pix_x[j1.number - 1], pix_y[j1.number - 1])
+        p2 = (pix_x[j2.number - 1], pix_y[j2.number - 1])
+        segments_by_color.setdefault(color, []).append((p1, p2))
+        joint_colors[p1] = color
+        joint_colors[p2] = color
+
+    # Draw member lines
+    for color, segments in segments_by_color.items():
+        cv2.polylines(image,
+                      pts=np.array(segments, dtype=np.int32),
+                      isClosed=False,
+                      color=color,
+                      thickness=line_thickness)
+
+    # Draw joints
+    for center, color in joint_colors.items():
         cv2.circle(image,
-                   center=(sketch_x(j1.x), sketch_y(j1.y)),
+                   center=center,
                    radius=line_thickness + 3,
-                   color=(r, g, b),
+                   color=color,
                    thickness=line_thickness - 1)
-        cv2.circle(image,
-                   center=(sketch_x(j2.x), sketch_y(j2.y)),
-                   radius=line_thickness + 3,
-                   color=(r, g, b),
-                   thickness=line_thickness - 1)
-        # Draw member line
-        cv2.line(image,
-                 pt1=(sketch_x(j1.x), sketch_y(j1.y)),
-                 pt2=(sketch_x(j2.x), sketch_y(j2.y)),
-                 color=(r, g, b),
-                 thickness=line_thickness)
-
-    image = cv2.rotate(image, rotateCode=cv2.ROTATE_180)
+
     return image
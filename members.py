@@ -19,6 +19,8 @@ def _world_coords(grid, grid_size):
 
 
 class Joint():
+    __slots__ = ('number', 'x', 'y')
+
     def __init__(self, number: int, x: int, y: int):
         self.number = number
         self.x = x
@@ -26,6 +28,8 @@ class Joint():
 
 
 class CrossSection():
+    __slots__ = ('material', 'material_index', 'section', 'size')
+
     def __init__(self,
                  parameters: Params,
                  material_index: int,
@@ -40,8 +44,21 @@ class CrossSection():
         return self.material.short_name == c.material.short_name \
             and self.section == c.section and self.size == c.size
 
+    # Hashable on the same fields is_equal compares (material_index
+    # uniquely identifies the material), so dedup is a set/dict insert
+    def __eq__(self, c) -> bool:
+        return isinstance(c, CrossSection) \
+            and self.material_index == c.material_index \
+            and self.section == c.section and self.size == c.size
+
+    def __hash__(self) -> int:
+        return hash((self.material_index, self.section, self.size))
+
 
 class Member():
+    __slots__ = ('number', 'start_joint', 'end_joint', 'cross_section',
+                 'compression', 'tension', 'length', 'cos_x', 'cos_y')
+
     def __init__(self,
                  number: int,
                  start_joint: Joint,
@@ -9,9 +9,12 @@ https://sourceforge.net/p/wpbdc/rails/ci/master/tree/vendor/gems/WPBDC/ext/WPBDC
 by Gene K. Ressler
 
 """
+from functools import lru_cache
 from typing import List
 from enum import Enum
 
+import numpy as np
+
 N_AVAILIBLE_MATERIALS = 3   # Number of available materials
 N_SECTIONS = 2              # Number of available sections
 
@@ -32,16 +35,6 @@ _width_tbl = [
 ]
 
 
-def _sqr(x: float):
-    """Square a float"""
-    return x * x
-
-
-def _p4(x: float):
-    """Compute fourth power of a float"""
-    return _sqr(_sqr(x))
-
-
 class Material():
     def __init__(self,
                  name: str,
@@ -154,7 +147,7 @@ class Params():
                      cost=[6.00, 7.70])
         )
         # Number of sizes available by section.
-        self.n_sizes = [N_BAR_SIZES, N_TUBE_SIZES]
+        self.n_sizes = (N_BAR_SIZES, N_TUBE_SIZES)
 
         # ===================
         # Setup Shapes
@@ -164,23 +157,50 @@ class Params():
             sections = []
             for size_index in range(self.n_sizes[section_index]):
                 width = _width_tbl[size_index]
+                width_2 = width * width
+                width_4 = width_2 * width_2
 
                 if section_index == Bar:
                     sections.append(
                         Shape(name=f"{width}x{width}",
                               width=width,
-                              area=_sqr(width) * 1e-6,
-                              moment=_p4(width) / 12 * 1e-12)
+                              area=width_2 * 1e-6,
+                              moment=width_4 / 12 * 1e-12)
                     )
                 elif section_index == Tube:
                     tube_thickness = width / 20
                     if (tube_thickness < 2):
                         tube_thickness = 2
+                    inner = width - 2 * tube_thickness
+                    inner_2 = inner * inner
+                    inner_4 = inner_2 * inner_2
                     sections.append(
                         Shape(name=f"{width}x{width}x{tube_thickness}",
                               width=width,
-                              area=(_sqr(width) - _sqr(width -
-                                    2 * tube_thickness)) * 1e-6,
-                              moment=(_p4(width) - _p4(width - 2 * tube_thickness)) / 12 * 1e-12)
+                              area=(width_2 - inner_2) * 1e-6,
+                              moment=(width_4 - inner_4) / 12 * 1e-12)
                     )
             self.shapes.append(sections)
+
+        # Flat lookup tables over (section, size), so hot paths can pull
+        # a shape's area/moment with one array index instead of two
+        # list indexes and an attribute fetch
+        self.shape_area_table = np.array(
+            [[shape.area for shape in sections] for sections in self.shapes])
+        self.shape_moment_table = np.array(
+            [[shape.moment for shape in sections] for sections in self.shapes])
+        self.shape_width_table = np.array(
+            [[shape.width for shape in sections] for sections in self.shapes],
+            dtype=np.float64)
+
+
+@lru_cache(maxsize=None)
+def get_params() -> Params:
+    """Returns the shared Params instance.
+
+    Params takes no arguments, is deterministic and is never mutated
+    after construction, so every Bridge can share one copy (including
+    the shape lookup tables) instead of rebuilding the 66 shapes per
+    bridge.
+    """
+    return Params()
@@ -9,8 +9,10 @@ https://sourceforge.net/p/wpbdc/rails/ci/master/tree/vendor/gems/WPBDC/ext/WPBDC
 by Gene K. Ressler
 
 """
+from functools import lru_cache
 from typing import List, Optional, Tuple
 from enum import Enum
+import numpy as np
 from py_bridge_designer.scenario_descriptions import scenario_descriptions_table
 from py_bridge_designer.members import Joint
 
@@ -22,11 +24,13 @@ INTERMEDIATE_SUPPORT = 8
 LOW_PIER = 0
 HIGH_PIER = 1
 
+# Support type by descriptor digit 8 (0 = simple/keep intermediate)
+_SUPPORT_FROM_KIND = (0, ARCH_SUPPORT, CABLE_SUPPORT_LEFT, CABLE_SUPPORT_BOTH)
+
 
 class ScenarioDescriptor():
     def __init__(self, index: int):
-        if index < 0 or index > 391:
-            index = 0
+        index = index if 0 <= index <= 391 else 0
         # type: Tuple(str, str, float)
         description = scenario_descriptions_table[index]
         self.index = index
@@ -35,6 +39,46 @@ class ScenarioDescriptor():
         self.site_cost: float = description[2]
 
 
+@lru_cache(maxsize=512)
+def _decode_scenario_id(scenario_id: str) -> Tuple[int, int, int, int, int, int, int]:
+    """Decodes the 10-digit scenario id into its fields.
+
+    Pure function of the id string, so results are memoized: repeated
+    LoadScenario construction (e.g. batched training environments)
+    parses each id only once per process.
+
+    Returns:
+        Tuple of (pier_type, intermediate_support_joint_no,
+        support_type, under_meters, over_meters, n_panels, load_case)
+    """
+    support_type = 0
+    # digit 10 => (0 = low pier, 1 = high pier)
+    pier_type = HIGH_PIER if int(scenario_id[9]) > 0 else LOW_PIER
+
+    # digit 9 => panel point at which pier is located. (0 = no pier).
+    intermediate_support_joint_no = int(scenario_id[8])
+    if (intermediate_support_joint_no > 0):
+        support_type = INTERMEDIATE_SUPPORT
+    # digit 8 => (0 = simple, 1 = arch, 2 = cable left, 3 = cable both)
+    # A nonzero kind overwrites the intermediate support, as before
+    support_kind = int(scenario_id[7])
+    if support_kind:
+        support_type = _SUPPORT_FROM_KIND[support_kind]
+
+    # digits 6 and 7 => meters under span
+    under_meters = int(scenario_id[5:7])
+    # digits 4 and 5 => meters over span
+    over_meters = int(scenario_id[3:5])
+    # digits 2 and 3 => number of bridge panels
+    n_panels = int(scenario_id[1:3])
+    # digit 1 is the load case, 1-based
+    # -1 correction for 0-based load_case table
+    load_case = int(scenario_id[0]) - 1
+
+    return (pier_type, intermediate_support_joint_no, support_type,
+            under_meters, over_meters, n_panels, load_case)
+
+
 class LoadScenario():
     def __init__(self, load_scenario_index: int):
         # ===================
@@ -42,39 +86,17 @@ class LoadScenario():
         # ===================
 
         self.desc: ScenarioDescriptor = ScenarioDescriptor(load_scenario_index)
-        # ===================
-        # Setup Support Types
-        # ===================
 
-        self.support_type = 0
-        # digit 10 => (0 = low pier, 1 = high pier)
-        self.pier_type = HIGH_PIER if int(self.desc.id[9]) > 0 else LOW_PIER
-
-        # digit 9 => panel point at which pier is located. (0 = no pier).
-        self.intermediate_support_joint_no = int(self.desc.id[8])
-        if (self.intermediate_support_joint_no > 0):
-            self.support_type = INTERMEDIATE_SUPPORT
-        # digit 8 => (0 = simple, 1 = arch, 2 = cable left, 3 = cable both)
-        if (self.desc.id[7] == '1'):
-            self.support_type = ARCH_SUPPORT
-        elif (self.desc.id[7] == '2'):
-            self.support_type = CABLE_SUPPORT_LEFT
-        elif (self.desc.id[7] == '3'):
-            self.support_type = CABLE_SUPPORT_BOTH
-
-        # ===================
-        # Setup Other Values
-        # ===================
-
-        # digits 6 and 7 => meters under span
-        self.under_meters = int(self.desc.id[5:7])
-        # digits 4 and 5 => meters over span
-        self.over_meters = int(self.desc.id[3:5])
-        # digits 2 and 3 => number of bridge panels
-        self.n_panels = int(self.desc.id[1:3])
-        # digit 1 is the load case, 1-based
-        # -1 correction for 0-based load_case table
-        self.load_case = int(self.desc.id[0]) - 1
+        # ===========================================
+        # Setup Support Types and Other Values
+        # ===========================================
+        (self.pier_type,
+         self.intermediate_support_joint_no,
+         self.support_type,
+         self.under_meters,
+         self.over_meters,
+         self.n_panels,
+         self.load_case) = _decode_scenario_id(self.desc.id)
 
         self.grid_size = 0.25
         panel_size = 16
@@ -84,96 +106,110 @@ class LoadScenario():
         self.num_length_grids = self.n_panels * panel_size
         self.n_loaded_joints = self.n_panels + 1
 
+        # Locals for the branching below; every self.* read is a
+        # descriptor dispatch
+        support_type = self.support_type
+        pier_type = self.pier_type
+        n_loaded_joints = self.n_loaded_joints
+        under_grids = self.under_grids
+        # x of the rightmost loaded joint, known as soon as n_panels is
+        right_x = self.n_panels * panel_size
+
         # Loaded joints are prescribed.
-        n_prescribed_joints = self.n_loaded_joints
+        n_prescribed_joints = n_loaded_joints
 
         # ================================
         # Update Support Types and Joints
         # ================================
 
         # Add one prescribed joint for the intermediate support, if any.
-        if ((self.support_type == INTERMEDIATE_SUPPORT) and (self.pier_type != HIGH_PIER)):
+        if ((support_type == INTERMEDIATE_SUPPORT) and (pier_type != HIGH_PIER)):
             n_prescribed_joints += 1
 
         # Another two for the arch base, if we have an arch.
-        if (self.support_type == ARCH_SUPPORT):
+        if (support_type == ARCH_SUPPORT):
             n_prescribed_joints += 2
 
         # And another one or two for cable anchorages if they're present.
-        if (self.support_type == CABLE_SUPPORT_LEFT or self.support_type == CABLE_SUPPORT_BOTH):
+        if (support_type == CABLE_SUPPORT_LEFT or support_type == CABLE_SUPPORT_BOTH):
             n_prescribed_joints += 1
-        if (self.support_type == CABLE_SUPPORT_BOTH):
+        if (support_type == CABLE_SUPPORT_BOTH):
             n_prescribed_joints += 1
 
         # ================================
         # Fill prescribed_joints Vector
         # ================================
-        self.prescribed_joints = []  # type: List[Joint]
-        joint_index = 0
-        x = 0
-        y = 0
-        x_values = []  # temp array to calculate the min and max values for this scenario
-        for _ in range(self.n_loaded_joints):
-            x_values.append(x)
-            self.prescribed_joints.append(
-                Joint(number=joint_index + 1,
-                      x=x,
-                      y=y)
-            )
-            x += panel_size
-            joint_index += 1
-
-        # Loop leaves joint_index pointing at next joint.  Add the low intermediate support, if any.
-        if ((self.support_type == INTERMEDIATE_SUPPORT) and (self.pier_type != HIGH_PIER)):
-            x = (self.intermediate_support_joint_no - 1) * panel_size
-            x_values.append(x)
-            self.prescribed_joints.append(
-                Joint(number=joint_index + 1,
-                      x=x,
-                      y=-self.under_grids)
-            )
-            joint_index += 1
+        # Build the coordinate lists first (the loaded joints are just
+        # an arange over panels), then construct the Joint objects in
+        # one comprehension at the end
+        x_values = (np.arange(n_loaded_joints, dtype=np.int32)
+                    * panel_size).tolist()
+        y_values = [0] * n_loaded_joints
+
+        # Add the low intermediate support, if any.
+        if ((support_type == INTERMEDIATE_SUPPORT) and (pier_type != HIGH_PIER)):
+            x_values.append(
+                (self.intermediate_support_joint_no - 1) * panel_size)
+            y_values.append(-under_grids)
 
         # Add the arch base supports, if any
-        if (self.support_type == ARCH_SUPPORT):
-            x = 0
-            x_values.append(x)
-            self.prescribed_joints.append(
-                Joint(number=joint_index + 1,
-                      x=x,
-                      y=-self.under_grids)
-            )
-            joint_index += 1
-            x = self.prescribed_joints[self.n_loaded_joints - 1].x
-            x_values.append(x)
-            self.prescribed_joints.append(
-                Joint(number=joint_index + 1,
-                      x=x,
-                      y=-self.under_grids)
-            )
-            joint_index += 1
+        if (support_type == ARCH_SUPPORT):
+            x_values.append(0)
+            y_values.append(-under_grids)
+            x_values.append(right_x)
+            y_values.append(-under_grids)
+
         self.cable_anchors_x: Optional[List[int]] = None
+        # min/max deliberately exclude the cable anchorages below
         self.max_x: int = max(x_values)
         self.min_x: int = min(x_values)
         # Add the cable anchorages, if any.
-        if (self.support_type == CABLE_SUPPORT_LEFT or self.support_type == CABLE_SUPPORT_BOTH):
+        if (support_type == CABLE_SUPPORT_LEFT or support_type == CABLE_SUPPORT_BOTH):
             x = -CABLE_ANCHORAGE_X_OFFSET
             self.cable_anchors_x = [x]
-            self.prescribed_joints.append(
-                Joint(number=joint_index + 1,
-                      x=x,
-                      y=0)
-            )
-            joint_index += 1
-        if (self.support_type == CABLE_SUPPORT_BOTH):
-            x = self.prescribed_joints[self.n_loaded_joints -
-                                       1].x + CABLE_ANCHORAGE_X_OFFSET
+            x_values.append(x)
+            y_values.append(0)
+        if (support_type == CABLE_SUPPORT_BOTH):
+            x = right_x + CABLE_ANCHORAGE_X_OFFSET
             if self.cable_anchors_x is not None:
                 self.cable_anchors_x.append(x)
-            self.prescribed_joints.append(
-                Joint(number=joint_index + 1,
-                      x=x,
-                      y=0)
-            )
-            joint_index += 1
+            x_values.append(x)
+            y_values.append(0)
+
+        self.prescribed_joints = [
+            Joint(number=number, x=x, y=y)
+            for number, (x, y) in enumerate(zip(x_values, y_values), start=1)
+        ]  # type: List[Joint]
         self.n_prescribed_joints = n_prescribed_joints
+
+        # SoA view of the prescribed joints (row j holds joint number
+        # j + 1) for vectorized consumers; treat as read-only
+        self.joint_x = np.array(x_values, dtype=np.int32)
+        self.joint_y = np.array(y_values, dtype=np.int32)
+        self.joint_numbers = np.arange(
+            1, n_prescribed_joints + 1, dtype=np.int32)
+        # ...and as one (n_prescribed_joints, 2) block for consumers
+        # that want distances/bounding boxes in a single expression
+        self.xy = np.column_stack((self.joint_x, self.joint_y))
+
+
+@lru_cache(maxsize=392)
+def get_load_scenario(load_scenario_index: int) -> LoadScenario:
+    """Returns the shared LoadScenario for a scenario index.
+
+    LoadScenario is deterministic in its index and is never mutated
+    after construction (Bridge only reads it), so the 392 possible
+    scenarios are built once per process and shared. Treat the
+    returned object, including prescribed_joints, as read-only.
+    """
+    return LoadScenario(load_scenario_index)
+
+
+def prewarm_load_scenarios():
+    """Builds all 392 load scenarios up front.
+
+    Optional: call once at startup to move scenario construction cost
+    out of the first reset of each training environment.
+    """
+    for index in range(392):
+        get_load_scenario(index)
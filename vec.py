@@ -0,0 +1,40 @@
+"""
+vec.py
+
+Py Bridge Designer
+by Nathan Hartzler
+"""
+import gymnasium as gym
+import numpy as np
+
+from py_bridge_designer.bridge_env import BridgeEnv
+
+
+def make_vec_env(num_envs: int, asynchronous: bool = True,
+                 load_scenario_index=None, **kwargs):
+    """Build a vectorized stack of BridgeEnv instances.
+
+    The action-space bounds depend on the load scenario, and vector
+    envs require homogeneous sub-env spaces, so all sub-envs share one
+    scenario index (drawn at random when not given) and keep it pinned
+    across autoresets.
+
+    Args:
+        num_envs: number of parallel environments
+        asynchronous: run each env in its own process via
+            AsyncVectorEnv; set False for in-process SyncVectorEnv
+            (easier debugging, no pickling)
+        load_scenario_index: scenario shared by every sub-env;
+            None picks one at random
+        **kwargs: forwarded to every BridgeEnv constructor
+    Returns:
+        A gymnasium vector env stepping num_envs bridges at once
+    """
+    if load_scenario_index is None:
+        load_scenario_index = int(np.random.default_rng().integers(0, 392))
+    env_fns = [
+        lambda: BridgeEnv(load_scenario_index=load_scenario_index, **kwargs)
+        for _ in range(num_envs)]
+    if asynchronous:
+        return gym.vector.AsyncVectorEnv(env_fns)
+    return gym.vector.SyncVectorEnv(env_fns)